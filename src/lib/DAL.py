@@ -1,15 +1,21 @@
 from sqlalchemy import create_engine
 import pyodbc
+import pyarrow.parquet as pq
 import pandas as pd
 import yaml
+import os
 
 class Repository:
-    def __init__(self, cfg):
+    def __init__(self, cfg, output_cfg=None, input_cfg=None):
         self.cfg = cfg
+        self.output_cfg = output_cfg
+        self.input_cfg = input_cfg
 
     def get(self):
         if (self.cfg['useDb']):
             return self.get_from_db()
+        if (self.input_cfg is not None and self.input_cfg['format'] != 'sample'):
+            return self.get_from_file()
         return self.get_sample()
 
     def get_from_db(self):
@@ -19,14 +25,63 @@ class Repository:
         conn.close()
         return df
 
+    def get_from_file(self):
+        path = self.input_cfg['path']
+        columns = self.input_cfg['columns']
+        if self.input_cfg['format'] == 'csv':
+            return pd.read_csv(path, usecols=columns, dtype={'npl_biblio': str})
+        elif self.input_cfg['format'] == 'jsonl':
+            return self.select_columns(pd.read_json(path, lines=True, dtype={'npl_biblio': str}), columns)
+        elif self.input_cfg['format'] == 'parquet':
+            return pd.read_parquet(path, columns=columns)
+        else:
+            raise ValueError(f"Unknown input format: {self.input_cfg['format']}")
+
+    def iter_file(self):
+        path = self.input_cfg['path']
+        columns = self.input_cfg['columns']
+        chunksize = self.input_cfg['chunksize']
+        if self.input_cfg['format'] == 'csv':
+            yield from pd.read_csv(path, usecols=columns, chunksize=chunksize, dtype={'npl_biblio': str})
+        elif self.input_cfg['format'] == 'jsonl':
+            for chunk in pd.read_json(path, lines=True, chunksize=chunksize, dtype={'npl_biblio': str}):
+                yield self.select_columns(chunk, columns)
+        elif self.input_cfg['format'] == 'parquet':
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+                yield batch.to_pandas()
+        else:
+            raise ValueError(f"Unknown input format: {self.input_cfg['format']}")
+
+    def select_columns(self, df, columns):
+        if columns is None:
+            return df
+        if df.empty:
+            return df.reindex(columns=columns)
+        return df[columns]
+
+    def connection_string(self):
+        return f"mssql+pyodbc://{self.cfg['username']}:{self.cfg['password']}@{self.cfg['server']}/{self.cfg['database']}?driver=ODBC Driver 17 for SQL Server"
+
     def post(self, extracted_bibliographic_items, clusters_of_name_variants, precision_recall_f1_analysis):
-        connection_string = f"mssql+pyodbc://{self.cfg['username']}:{self.cfg['password']}@{self.cfg['server']}/{self.cfg['database']}?driver=ODBC Driver 17 for SQL Server"
-        engine = create_engine(connection_string)
+        engine = create_engine(self.connection_string())
         extracted_bibliographic_items.to_sql('extracted_bibliographic_items_group10', con=engine, if_exists='replace', index=False)
         (clusters_of_name_variants.astype(str)).to_sql('clusters_of_name_variants_group10', con=engine, if_exists='replace', index=False)
         precision_recall_f1_analysis.to_sql('precision_recall_f1_analysis_group10', con=engine, if_exists='replace', index=False)
         engine.dispose()
 
+    def post_normalized(self, cluster_membership, cluster_variants):
+        if self.output_cfg['format'] == 'db':
+            engine = create_engine(self.connection_string())
+            cluster_membership.to_sql('cluster_membership_group10', con=engine, if_exists='replace', index=False)
+            cluster_variants.to_sql('cluster_variants_group10', con=engine, if_exists='replace', index=False)
+            engine.dispose()
+        elif self.output_cfg['format'] == 'parquet':
+            os.makedirs(self.output_cfg['path'], exist_ok=True)
+            cluster_membership.to_parquet(os.path.join(self.output_cfg['path'], 'cluster_membership.parquet'), index=False)
+            cluster_variants.to_parquet(os.path.join(self.output_cfg['path'], 'cluster_variants.parquet'), index=False)
+        else:
+            raise ValueError(f"Unknown normalized output format: {self.output_cfg['format']}")
+
     def get_sample(self):
         with open('samples/sample.yaml') as f:
             data = yaml.load(f, Loader=yaml.FullLoader)
@@ -1,6 +1,40 @@
 import pandas as pd
+import unicodedata
 import re
 
+PRE_EXTRACTION_REPLACEMENTS = {
+    'pages': 'page',
+    'seiten': 'page',
+    'seite': 'page',
+    'pp.': 'page ',
+    'volume ': 'vol.',
+    'jan.': 'january ',
+    'feb.': 'february ',
+    'mar.': 'march ',
+    'apr.': 'april ',
+    'jun.': 'june ',
+    'jul.': 'july ',
+    'juli': 'july',
+    'aug.': 'august ',
+    'sep.': 'september ',
+    'sept.': 'september ',
+    'oct.': 'october ',
+    'okt.': 'october ',
+    'oktober': 'october',
+    'nov.': 'november ',
+    'dec.': 'december ',
+    'nr. ': 'no. '
+}
+
+BRACKETS_TABLE = str.maketrans('', '', '()<>')
+CLEAN_TEXT_PATTERN = re.compile(r'vol\.|no\.|s-s| -|page|,|\.\.')
+MULTIPLE_SPACES_PATTERN = re.compile(r' +')
+
+LEADING_ZEROS = {
+    '01': '1', '02': '2', '03': '3', '04': '4',
+    '05': '5', '06': '6', '07': '7', '08': '8', '09': '9'
+}
+
 ## Cleans and preprocesses data in the DataFrame 'df'.
 # Performs several cleaning and text extraction operations, such as removing diacritics, normalizing text, 
 # and extracting specific patterns (e.g., 'XP' numbers, volume, ISSN, ISBN, DOI, issue, year, page start, page end, etc.).
@@ -24,6 +58,86 @@ def clean_data(df):
 
     return df
 
+## Builds the regular expression for a trie of tokens.
+# Tokens sharing a prefix share one branch, so the regex engine follows a single path per position,
+# like an Aho-Corasick automaton. Tokens ending with a letter only match at the end of a word.
+# @param trie: A nested dictionary of characters, where the key '' marks the end of a token.
+# @return: The regular expression for the trie.
+#
+def trie_to_regex(trie):
+    branches = []
+    for char, child in sorted(trie.items()):
+        if char != '':
+            branches.append(re.escape(char) + trie_to_regex(child))
+    if '' in trie:
+        branches.append(r'(?![a-z])' if trie[''][-1].isalpha() else '')  # End of token last, so longer tokens win
+    if len(branches) == 1:
+        return branches[0]
+    return '(?:' + '|'.join(branches) + ')'
+
+## Builds one compiled regular expression that replaces all tokens of 'replacements' in a single pass.
+# Longer tokens win over their prefixes, so 'seiten' is matched before 'seite'. Tokens starting with a letter
+# must follow whitespace or punctuation and tokens ending with a letter must end the word, so e.g. 'juli' is
+# not replaced inside 'julia' and 'jan.' is not replaced inside '12jan.'.
+# Text matching one of the 'protected' patterns is captured in the group 'protected' and must be kept as is.
+# @param replacements: A dictionary mapping tokens to their replacement.
+# @param protected: A list of regular expressions for spans that must not be changed.
+# @return: The compiled regular expression.
+#
+def build_replacement_pattern(replacements, protected=None):
+    word_trie, other_trie = {}, {}
+    for token in replacements:
+        node = word_trie if token[0].isalpha() else other_trie
+        for char in token:
+            node = node.setdefault(char, {})
+        node[''] = token
+    alternatives = []
+    if protected:
+        alternatives.append('(?P<protected>' + '|'.join(protected) + ')')
+    if word_trie:
+        alternatives.append(r'(?<!\w)' + trie_to_regex(word_trie))
+    if other_trie:
+        alternatives.append(trie_to_regex(other_trie))
+    return re.compile('|'.join(alternatives))
+
+## Spans that are extracted later on and must reach extraction unchanged: DOIs, URLs and quoted titles.
+PRE_EXTRACTION_PROTECTED = [
+    r'doi\s?:?\s?[^, "\n]+',
+    r'url\S*',
+    r'https?://[^ ,">]*',
+    r'www[^ ,">]*',
+    r"'.*?'"
+]
+
+PRE_EXTRACTION_PATTERN = build_replacement_pattern(PRE_EXTRACTION_REPLACEMENTS, PRE_EXTRACTION_PROTECTED)
+
+## Returns the replacement for a match of 'PRE_EXTRACTION_PATTERN', keeping protected spans unchanged.
+# @param match: The match of 'PRE_EXTRACTION_PATTERN'.
+# @return: The replacement text.
+#
+def replace_pre_extraction_token(match):
+    if match['protected'] is not None:
+        return match[0]
+    return PRE_EXTRACTION_REPLACEMENTS[match[0]]
+
+## Normalizes a publication before extraction.
+# Strips the text, folds it to ASCII, lowercases it and replaces all tokens of 'PRE_EXTRACTION_REPLACEMENTS'
+# (month abbreviations, 'pp.', 'seiten', ...) anywhere in the text in a single pass, except inside DOIs, URLs
+# and quoted titles. Dotted abbreviations are replaced with a trailing space, so 'mar.2019' keeps the year as
+# a separate word; runs of spaces are collapsed afterwards.
+# @param text: The raw publication.
+# @return: The normalized text.
+#
+def normalize_text(text):
+    text = text.strip()
+    if not text.isascii():
+        text = unicodedata.normalize('NFKD', text)  # Normalize unicode (e.g., é → e +  ́)
+        text = text.encode('ascii', errors='ignore').decode('ascii')  # Remove diacritics by ignoring non-ASCII
+    text = text.lower()
+    text = PRE_EXTRACTION_PATTERN.sub(replace_pre_extraction_token, text)
+    text = MULTIPLE_SPACES_PATTERN.sub(' ', text)  # Remove multiple spaces
+    return text.strip()
+
 ## Extracts a pattern from a given text using regular expressions and removes it.
 # @param text: The string with the characters to check.
 # @param pattern: The regular expression pattern to search for.
@@ -146,14 +260,33 @@ def keep_alphanumeric(text):
     else:
         return text
 
+## Cleans a DOI by removing the 'doi:' prefix and keeping only alphanumeric characters.
+# @param text: The DOI to be cleaned.
+# @return: The cleaned DOI.
+#
+def clean_doi(text):
+    if text is not None:
+        text = text.replace('doi:', '').replace('doi', '')
+    return keep_alphanumeric(text)
+
+## Cleans a day or page number by removing 'th' and dots and dropping a leading zero from two-digit numbers.
+# @param text: The number to be cleaned.
+# @return: The cleaned number.
+#
+def clean_number(text):
+    if text is None:
+        return text
+    text = text.replace('th', '').replace('.', '')
+    return LEADING_ZEROS.get(text, text)
+
 ## Cleans a text by removing specific patterns and extra spaces.
 # @param text: The text to be cleaned.
 # @return: The cleaned text with patterns removed and extra spaces removed.
 #
 def clean_text(text):
-    text = re.sub(r'[()<>]', '', text)  # Remove parentheses and angle brackets
-    text = re.sub(r'vol\.|no\.|s-s| -|page|,|\.\.', '', text)  # Remove specific patterns
-    text = re.sub(r' +', ' ', text)  # Remove multiple spaces
+    text = text.translate(BRACKETS_TABLE)  # Remove parentheses and angle brackets
+    text = CLEAN_TEXT_PATTERN.sub('', text)  # Remove specific patterns
+    text = MULTIPLE_SPACES_PATTERN.sub(' ', text)  # Remove multiple spaces
     text = text.strip()  # Remove leading/trailing whitespace
     return text
 
@@ -212,41 +345,7 @@ def text_left(text):
     return None
 
 def pre_extraction_cleaning(df):
-    replacements = {
-        '  ': ' ',
-        'pages': 'page',
-        'seiten': 'page',
-        'seite': 'page',
-        'pp.': 'page',
-        'volume ': 'vol.',
-        'jan.': 'january',
-        'feb.': 'february',
-        'mar.': 'march',
-        'apr.': 'april',
-        'jun.': 'june',
-        'jul.': 'july',
-        'juli': 'july',
-        'aug.': 'august',
-        'sep.': 'september',
-        'sept.': 'september',
-        'oct.': 'october',
-        'okt.': 'october',
-        'oktober': 'october',
-        'nov.': 'november',
-        'dec.': 'december',
-        'nr. ': 'no.'
-    }
-
-    df['npl_biblio'] = (
-        df['npl_biblio']
-        .str.strip()  # Remove leading/trailing whitespace
-        .str.normalize('NFKD')  # Normalize unicode (e.g., é → e +  ́)
-        .str.encode('ascii', errors='ignore')  # Remove diacritics by ignoring non-ASCII
-        .str.decode('utf-8')  # Decode bytes back to string
-        .str.lower()  # Convert to lowercase
-        .replace(replacements, regex=False)
-    )
-
+    df['npl_biblio'] = df['npl_biblio'].apply(normalize_text)
     return df
 
 def extract_and_remove_1(df):
@@ -301,8 +400,7 @@ def final_cleaning(df):
     df['rest_text'] = df['npl_biblio']
     df['npl_biblio'] = None
 
-    df['DOI'] = df['DOI'].str.replace('doi:', '', regex=False).str.replace('doi', '', regex=False)
-    df['DOI'] = df['DOI'].apply(keep_alphanumeric)
+    df['DOI'] = df['DOI'].apply(clean_doi)
 
     url_replacements = {'url': '', 'http': '', 'www': '', ' ': ''}
     df['url'] = df['url'].replace(url_replacements, regex=False)
@@ -310,13 +408,7 @@ def final_cleaning(df):
     df['page end'] = df.apply(add_extra_digits, axis=1)
 
     for col in ['day', 'page start', 'page end']:
-        df[col] = df[col].str.replace('th', '', regex=False).str.replace('.', '', regex=False)
-        df[col] = df[col].apply(
-            lambda x: x if x is None or len(x) != 2 else {
-                '01': '1', '02': '2', '03': '3', '04': '4',
-                '05': '5', '06': '6', '07': '7', '08': '8', '09': '9'
-            }.get(x, x)
-        )
+        df[col] = df[col].apply(clean_number)
 
     return df
 
@@ -1,17 +1,23 @@
 import pandas as pd
+from collections import OrderedDict
+import sys
 
 class Clustering:
-    def __init__(self, jaccard_threshold_words, col_list, threshold, a_list):      
+    def __init__(self, jaccard_threshold_words, col_list, threshold, a_list, cache_size=0):      
         self.jaccard_threshold_words = jaccard_threshold_words
         self.col_list = col_list
         self.threshold = threshold
         self.a_list = a_list
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     ## Clusters data in the 'df' DataFrame.
     # Initializes an empty 'dc' DataFrame with the same columns as 'df'.
     # Loops through rows in 'df' and compares them with existing clusters in 'dc' using 'sim_check_row'.
     # If similarity counter is less than the threshold, adds a new cluster using 'add_new_cluster'.
-    # Finally, sorts the 'dc' DataFrame based on 'npl_publn_id'.
+    # Finally, sorts the 'dc' DataFrame based on 'npl_publn_id' and numbers the clusters in 'system_cluster_id'.
     # @param df: The DataFrame to be clustered.
     # @return: The 'dc' DataFrame after clustering.
     #
@@ -28,6 +34,7 @@ class Clustering:
             if counter < self.threshold:
                 dc = self.add_new_cluster(dc, df_row)
             dc = self.sort_dataframe(dc, 'npl_publn_id')
+        dc.insert(0, 'system_cluster_id', range(len(dc)))
         print('done clustering')
         return dc
 
@@ -53,14 +60,51 @@ class Clustering:
     #
     def sim_check_value(self, str1, str2, a_col, counter):
         if str1 is not None and str2 is not None:
-            if str1.isnumeric() and str2.isnumeric():
-                if str1 == str2:
-                    counter = counter + a_col
-            else:
-                if self.jaccard_index_words(str1, str2) >= self.jaccard_threshold_words:
-                    counter = counter + a_col
+            if self.is_similar_cached(str1, str2):
+                counter = counter + a_col
         return counter
 
+    ## Checks whether two strings are similar.
+    # Numeric strings must be equal, other strings need a word-level Jaccard index of at least 'jaccard_threshold_words'.
+    # @param str1: The first string.
+    # @param str2: The second string.
+    # @return: True if the strings are similar, otherwise False.
+    #
+    def is_similar(self, str1, str2):
+        if str1.isnumeric() and str2.isnumeric():
+            return str1 == str2
+        return self.jaccard_index_words(str1, str2) >= self.jaccard_threshold_words
+
+    ## Checks whether two strings are similar, memoizing the result in a bounded LRU cache.
+    # The cache is keyed on the interned (unordered) value pair and holds at most 'cache_size' entries;
+    # the least recently used entry is evicted first. A 'cache_size' of 0 disables the cache.
+    # @param str1: The first string.
+    # @param str2: The second string.
+    # @return: True if the strings are similar, otherwise False.
+    #
+    def is_similar_cached(self, str1, str2):
+        if self.cache_size <= 0:
+            return self.is_similar(str1, str2)
+        key = (sys.intern(str1), sys.intern(str2)) if str1 <= str2 else (sys.intern(str2), sys.intern(str1))
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.cache_hits = self.cache_hits + 1
+            return self.cache[key]
+        self.cache_misses = self.cache_misses + 1
+        result = self.is_similar(str1, str2)
+        self.cache[key] = result
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return result
+
+    ## Returns the statistics of the similarity cache.
+    # @return: A dictionary with the number of hits, misses, the hit rate and the current cache size.
+    #
+    def cache_stats(self):
+        lookups = self.cache_hits + self.cache_misses
+        hit_rate = self.cache_hits / lookups if lookups != 0 else 0.0
+        return {'hits': self.cache_hits, 'misses': self.cache_misses, 'hit_rate': hit_rate, 'size': len(self.cache)}
+
     ## Checks the similarity between two cells in a given column and increments a counter if they are similar.
     # The similarity is measured based on the `sim_check_value` function.
     # @param col: The column for which to compare the cells.
@@ -157,4 +201,45 @@ class Clustering:
     #
     def sort_dataframe(self, df, col):
         df_sorted = df.assign(Column1_Length=df[col].astype(str).str.len()).sort_values(by='Column1_Length', ascending=False).drop('Column1_Length', axis=1)
-        return df_sorted
\ No newline at end of file
+        return df_sorted
+
+    ## Returns a cell value as a list, wrapping single values and dropping missing ones.
+    # @param value: The cell value from the 'dc' DataFrame (a list or a single value).
+    # @return: A list with the non-missing values of the cell.
+    #
+    def cell_values(self, value):
+        if isinstance(value, list):
+            return [v for v in value if v is not None and str(v) != 'None']
+        if value is None or str(value) == 'None' or pd.isna(value):
+            return []
+        return [value]
+
+    ## Builds a normalized membership table from the 'dc' DataFrame.
+    # One row is emitted per publication in a cluster, so consumers no longer have to parse the list-valued
+    # 'npl_publn_id' column. 'system_cluster_id' joins back to the 'dc' DataFrame.
+    # @param dc: The 'dc' DataFrame returned by `cluster_data`.
+    # @return: A DataFrame with the integer columns 'npl_publn_id' and 'system_cluster_id'.
+    #
+    def membership_table(self, dc):
+        rows = []
+        for system_cluster_id, value in zip(dc['system_cluster_id'], dc['npl_publn_id']):
+            for npl_publn_id in self.cell_values(value):
+                rows.append((int(str(npl_publn_id).strip("'")), system_cluster_id))
+        membership = pd.DataFrame(rows, columns=['npl_publn_id', 'system_cluster_id'])
+        return membership.astype({'npl_publn_id': 'int64', 'system_cluster_id': 'int64'})
+
+    ## Builds a normalized variants table from the 'dc' DataFrame.
+    # Emits one row per cluster, per column in 'col_list' and per distinct value found in that cell.
+    # @param dc: The 'dc' DataFrame returned by `cluster_data`.
+    # @return: A DataFrame with the columns 'system_cluster_id' (int64), 'column' (category) and 'variant' (string).
+    #
+    def variants_table(self, dc):
+        rows = []
+        for system_cluster_id, *values in dc[['system_cluster_id'] + self.col_list].itertuples(index=False, name=None):
+            for col, value in zip(self.col_list, values):
+                for variant in self.cell_values(value):
+                    rows.append((system_cluster_id, col, str(variant)))
+        variants = pd.DataFrame(rows, columns=['system_cluster_id', 'column', 'variant'])
+        variants = variants.astype({'system_cluster_id': 'int64', 'variant': 'string'})
+        variants['column'] = pd.Categorical(variants['column'], categories=self.col_list)
+        return variants
@@ -9,15 +9,21 @@ def main():
     with open('.config/config.yaml') as f:
         cfg = yaml.load(f, Loader=yaml.FullLoader)
 
-        repo = Repository(cfg['dbAccess'])
+        repo = Repository(cfg['dbAccess'], cfg['normalizedOutput'], cfg['fileInput'])
         df = repo.get()
         extracted_bibliographic_items = clean_data(df)
-        clusters_of_name_variants = Clustering(cfg['jaccard_threshold_words'], cfg['column_titles'], cfg['threshold'], cfg['weights']).cluster_data(extracted_bibliographic_items)
+        clustering = Clustering(cfg['jaccard_threshold_words'], cfg['column_titles'], cfg['threshold'], cfg['weights'], cfg['similarity_cache_size'])
+        clusters_of_name_variants = clustering.cluster_data(extracted_bibliographic_items)
+        if (cfg['similarity_cache_size'] > 0):
+            print(clustering.cache_stats())
         precision_recall_f1_analysis = f1_measure_top100(df,clusters_of_name_variants)
         output(precision_recall_f1_analysis)
 
         if (repo.cfg['useDb']):
             repo.post(extracted_bibliographic_items, clusters_of_name_variants, precision_recall_f1_analysis)
 
+        if (cfg['normalizedOutput']['enabled']):
+            repo.post_normalized(clustering.membership_table(clusters_of_name_variants), clustering.variants_table(clusters_of_name_variants))
+
 if __name__ == '__main__':
     main()
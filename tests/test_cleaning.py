@@ -0,0 +1,31 @@
+from lib.cleaning import normalize_text, extract_and_remove_pattern, extract_and_remove_url, extract_and_remove_month, clean_doi, build_replacement_pattern
+
+
+def test_normalize_text_keeps_doi():
+    text = normalize_text('Smith J. doi:10.1111/jan.13890 jan. 2019')
+    assert text == 'smith j. doi:10.1111/jan.13890 january 2019'
+    doi, text = extract_and_remove_pattern(text, r'doi\s?:?\s?([^, "\n]+)', 1)
+    assert clean_doi(doi) == '101111jan13890'
+
+
+def test_normalize_text_keeps_url():
+    text = normalize_text('See http://www.example.org/dec.2018/paper.pdf')
+    assert text == 'see http://www.example.org/dec.2018/paper.pdf'
+    url, text = extract_and_remove_url(text)
+    assert url == 'www.example.org/dec.2018/paper.pdf'
+    assert extract_and_remove_month(text)[1] is None
+
+
+def test_normalize_text_keeps_quoted_title():
+    assert normalize_text("Doe, 'Juli paper', juli 2019") == "doe, 'juli paper', july 2019"
+
+
+def test_normalize_text_replaces_tokens_inside_text():
+    assert normalize_text('Doe A. mar.2019 sept. 12 nr. 7 pp.3   x') == 'doe a. march 2019 september 12 no. 7 page 3 x'
+    assert normalize_text('Julia x 12jan. seiten') == 'julia x 12jan. page'
+
+
+def test_build_replacement_pattern_prefers_longer_tokens():
+    replacements = {'no.': 'X', 'no. x': 'Y'}
+    pattern = build_replacement_pattern(replacements)
+    assert pattern.sub(lambda match: replacements[match[0]], 'no. x no.') == 'Y X'
@@ -0,0 +1,52 @@
+import pandas as pd
+
+from lib.DAL import Repository
+
+
+def make_repository(path, file_format, columns=None, chunksize=2):
+    input_cfg = {'format': file_format, 'path': str(path), 'columns': columns, 'chunksize': chunksize}
+    return Repository({'useDb': False}, input_cfg=input_cfg)
+
+
+def make_golden_set():
+    return pd.DataFrame({
+        'cluster_id': [101, 102, 102],
+        'npl_publn_id': [101, 102, 103],
+        'npl_biblio': ['a', 'b', 'c'],
+        'extra': ['x', 'y', 'z']
+    })
+
+
+def test_iter_file_csv_yields_projected_chunks(tmp_path):
+    path = tmp_path / 'golden.csv'
+    make_golden_set().to_csv(path, index=False)
+    repo = make_repository(path, 'csv', ['npl_publn_id', 'npl_biblio'])
+    chunks = list(repo.iter_file())
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert all(list(chunk.columns) == ['npl_publn_id', 'npl_biblio'] for chunk in chunks)
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), repo.get_from_file())
+
+
+def test_iter_file_parquet_yields_projected_chunks(tmp_path):
+    path = tmp_path / 'golden.parquet'
+    make_golden_set().to_parquet(path, index=False)
+    repo = make_repository(path, 'parquet', ['cluster_id', 'npl_publn_id'])
+    chunks = list(repo.iter_file())
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), repo.get_from_file())
+
+
+def test_jsonl_without_columns_keeps_all_columns(tmp_path):
+    path = tmp_path / 'golden.jsonl'
+    make_golden_set().to_json(path, orient='records', lines=True)
+    repo = make_repository(path, 'jsonl')
+    assert list(repo.get_from_file().columns) == ['cluster_id', 'npl_publn_id', 'npl_biblio', 'extra']
+    assert sum(len(chunk) for chunk in repo.iter_file()) == 3
+
+
+def test_get_from_file_empty_export(tmp_path):
+    path = tmp_path / 'golden.csv'
+    make_golden_set().head(0).to_csv(path, index=False)
+    df = make_repository(path, 'csv', ['npl_publn_id', 'npl_biblio']).get_from_file()
+    assert df.empty
+    assert list(df.columns) == ['npl_publn_id', 'npl_biblio']